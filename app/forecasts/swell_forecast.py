@@ -1,12 +1,21 @@
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict
 from datetime import datetime
 import os
+import time
 from pathlib import Path
 
+from app.forecasts.stormglass_forecast import get_stormglass_forecast
+from app.utils.date_utils import parse_hebrew_date, parse_slot_start_time
+
 # Constants
 FORECAST_CACHE_FILE = Path(__file__).parent.parent / "data" / "marine_forecast.json"
 FORECAST_CACHE_DURATION = 6  # Hours before refreshing forecast
+FORECAST_MEMO_SECONDS = 600  # Seconds a loaded forecast is reused from memory
+FORECAST_FAILURE_MEMO_SECONDS = 120  # Seconds a failed load is remembered before trying again
 
 # Israel coastal coordinates (Herzliya Marina)
 DEFAULT_LATITUDE = 32.1640
@@ -16,10 +25,40 @@ DEFAULT_LONGITUDE = 34.7914
 REFERENCE_NEW_MOON = datetime(2000, 1, 6).date()
 LUNAR_CYCLE_DAYS = 29.53  # Length of synodic month
 
+# (days, latitude, longitude) -> (monotonic time the entry expires, forecast or None)
+_forecast_memo = {}
+
+# Shared session so forecast refreshes reuse kept-alive connections to Open-Meteo;
+# transient 429/5xx responses are retried with backoff before falling back to the cache
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+    pool_connections=2,
+    pool_maxsize=4
+))
+# (connect, read) timeout for forecast requests, so a stalled API can't hang the monitor
+_REQUEST_TIMEOUT = (3.05, 15)
+
 def get_swell_forecast(days=7, latitude=DEFAULT_LATITUDE, longitude=DEFAULT_LONGITUDE):
     """
     Get marine forecast (waves and wind) for the specified number of days
     """
+    # Per-slot lookups call this repeatedly; serve them from memory for a while
+    # instead of re-reading and re-parsing the cache file every time
+    memo_key = (days, latitude, longitude)
+    memo = _forecast_memo.get(memo_key)
+    if memo and time.monotonic() < memo[0]:
+        return memo[1]
+    
+    # Failures are remembered too, briefly, so an Open-Meteo outage with no cache file
+    # costs one round of retries rather than one per slot
+    forecast = _fetch_swell_forecast(days, latitude, longitude)
+    ttl = FORECAST_MEMO_SECONDS if forecast else FORECAST_FAILURE_MEMO_SECONDS
+    _forecast_memo[memo_key] = (time.monotonic() + ttl, forecast)
+    return forecast
+
+def _fetch_swell_forecast(days, latitude, longitude):
+    """Load the forecast from the cache file, or fetch it from Open-Meteo when stale"""
     # Check if we have a recent cached forecast
     if should_use_cached_forecast():
         return load_cached_forecast()
@@ -48,12 +87,12 @@ def get_swell_forecast(days=7, latitude=DEFAULT_LATITUDE, longitude=DEFAULT_LONG
     
     try:
         # Get marine data
-        marine_response = requests.get(marine_url)
+        marine_response = _session.get(marine_url, timeout=_REQUEST_TIMEOUT)
         marine_response.raise_for_status()
         marine_data = marine_response.json()
         
         # Get weather data
-        weather_response = requests.get(weather_url)
+        weather_response = _session.get(weather_url, timeout=_REQUEST_TIMEOUT)
         weather_response.raise_for_status()
         weather_data = weather_response.json()
         
@@ -191,15 +230,10 @@ def process_combined_forecast(marine_data, weather_data):
         hourly_visibility = weather_data["hourly"].get("visibility", [])
         
         # Process the hourly data by date
-        date_indices_map = {}
+        date_indices_map = defaultdict(list)
         
         for i, time_str in enumerate(hourly_time):
-            date_str = time_str.split("T")[0]
-            
-            if date_str not in date_indices_map:
-                date_indices_map[date_str] = []
-            
-            date_indices_map[date_str].append(i)
+            date_indices_map[time_str.split("T")[0]].append(i)
         
         # Calculate the aggregated values for each date
         for date_str, indices in date_indices_map.items():
@@ -369,8 +403,6 @@ def save_forecast_to_cache(forecast_data):
 def get_simplified_forecast(days=7):
     """Get a simplified version of the forecast for display"""
     # Try StormGlass first (no fallback to Open-Meteo)
-    from app.forecasts.stormglass_forecast import get_stormglass_forecast
-    
     forecast, error = get_stormglass_forecast(days=days)
     
     if not forecast or "daily" not in forecast:
@@ -460,53 +492,18 @@ def get_forecast_for_slot(slot):
     if not slot or "date" not in slot:
         return None
     
-    # Extract date from slot
-    slot_date = slot.get("date", "")
-    
+    # Parse Hebrew date format (e.g., "שישי, 12 אפריל 2025")
+    return _get_forecast_for_slot_date(parse_hebrew_date(slot.get("date", "")))
+
+def _get_forecast_for_slot_date(slot_date):
+    """Get the forecast for an already parsed slot date, falling back to today's"""
     try:
-        # Try to parse Hebrew date format (e.g., "שישי, 12 אפריל 2025")
-        # Handle Hebrew month names
-        hebrew_month_names = {
-            "ינואר": "January",
-            "פברואר": "February",
-            "מרץ": "March",
-            "אפריל": "April",
-            "מאי": "May",
-            "יוני": "June",
-            "יולי": "July",
-            "אוגוסט": "August",
-            "ספטמבר": "September",
-            "אוקטובר": "October",
-            "נובמבר": "November",
-            "דצמבר": "December"
-        }
-        
-        # Try to parse the date
-        if "," in slot_date:
-            # Format like "שישי, 12 אפריל 2025"
-            day_name, date_part = slot_date.split(",", 1)
-            day_name = day_name.strip()
-            date_part = date_part.strip()
-            
-            parts = date_part.split()
-            if len(parts) >= 3:  # day, month, year
-                day_num = parts[0]
-                month_name = parts[1]
-                year = parts[2]
-                
-                # Translate Hebrew month name if needed
-                if month_name in hebrew_month_names:
-                    month_name = hebrew_month_names[month_name]
-                
-                # Try to parse the date
-                date_obj = datetime.strptime(f"{day_num} {month_name} {year}", "%d %B %Y")
-                date_str = date_obj.strftime("%Y-%m-%d")
-                
-                forecast = get_forecast_for_date(date_str)
-                if forecast:
-                    return forecast
+        if slot_date:
+            forecast = get_forecast_for_date(slot_date.strftime("%Y-%m-%d"))
+            if forecast:
+                return forecast
     except Exception as e:
-        print(f"Error parsing slot date: {e}")
+        print(f"Error getting slot date forecast: {e}")
     
     # If we couldn't parse the date, try to get today's forecast
     try:
@@ -529,67 +526,21 @@ def get_forecast_for_slot(slot):
 def format_slot_forecast(slot):
     """Format forecast data for a slot in a compact way"""
     try:
-        # Calculate if the slot date is within 6 days from today
-        is_within_forecast_range = False
-        try:
-            # Extract date from slot
-            slot_date = slot.get("date", "")
-            
-            # Try to parse Hebrew date format (e.g., "שישי, 12 אפריל 2025")
-            if "," in slot_date:
-                # Handle Hebrew month names
-                hebrew_month_names = {
-                    "ינואר": "January", "פברואר": "February", "מרץ": "March",
-                    "אפריל": "April", "מאי": "May", "יוני": "June",
-                    "יולי": "July", "אוגוסט": "August", "ספטמבר": "September",
-                    "אוקטובר": "October", "נובמבר": "November", "דצמבר": "December"
-                }
-                
-                day_name, date_part = slot_date.split(",", 1)
-                date_part = date_part.strip()
-                
-                parts = date_part.split()
-                if len(parts) >= 3:  # day, month, year
-                    day_num = parts[0]
-                    month_name = parts[1]
-                    year = parts[2]
-                    
-                    # Translate Hebrew month name if needed
-                    if month_name in hebrew_month_names:
-                        month_name = hebrew_month_names[month_name]
-                    
-                    # Parse the date
-                    slot_date_obj = datetime.strptime(f"{day_num} {month_name} {year}", "%d %B %Y").date()
-                    today_date = datetime.now().date()
-                    
-                    # Check if the slot is within 6 days from today
-                    delta = (slot_date_obj - today_date).days
-                    is_within_forecast_range = 0 <= delta <= 6
-        except Exception:
-            # If we can't parse the date, assume it's in range to be safe
-            is_within_forecast_range = True
-        
-        # If not within forecast range (>6 days ahead), return empty string
-        if not is_within_forecast_range:
+        # Parse the slot date once; it drives both the range check and the lookup
+        slot_date = parse_hebrew_date(slot.get("date", ""))
+        
+        # Only show forecasts for slots within 6 days from today
+        if slot_date is None or not 0 <= (slot_date - datetime.now().date()).days <= 6:
             return ""
-            
-        forecast = get_forecast_for_slot(slot)
+        
+        forecast = _get_forecast_for_slot_date(slot_date)
         
         if not forecast:
             return ""  # Empty string for no forecast
         
         # Get time of day for this slot to determine if we show moon phase
-        is_evening = False
-        if "time" in slot:
-            slot_time = slot["time"]
-            # Check if slot starts in evening/night (after sunset)
-            if "-" in slot_time:
-                start_time = slot_time.split("-")[0].strip()
-                try:
-                    hour = int(start_time.split(":")[0])
-                    is_evening = hour >= 18 or hour < 6  # Assume evening/night hours
-                except (ValueError, IndexError):
-                    pass
+        start_time = parse_slot_start_time(slot.get("time", ""))
+        is_evening = start_time is not None and (start_time.hour >= 18 or start_time.hour < 6)  # Assume evening/night hours
         
         # Swell information
         swell_height = round(forecast.get("max_swell_height", 0), 1)
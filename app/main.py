@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import sys
 import argparse
 from app.scrapers.cookie_scraper import scrape_calendar_slots_for_days
@@ -136,6 +137,8 @@ def parse_arguments():
     return args
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     if len(sys.argv) == 1:
         print("Usage: python -m app.main [scrape|calendar|monitor|club] [options]")
         print("For more information, use --help")
@@ -1,12 +1,25 @@
 import asyncio
 import json
+import logging
 import os
+import random
 from datetime import datetime
 from pathlib import Path
 
 from app.scrapers.club_scraper import scrape_club_activities_for_days
 from app.monitors.slack_notifier import SlackNotifier
 from app.utils.config import CLUB_PREVIOUS_SLOTS_FILE, CLUB_NOTIFIED_SLOTS_FILE
+from app.utils.date_utils import HEBREW_DAY_SHORT, HEBREW_DAY_TO_ENGLISH, HEBREW_MONTH_NAMES, HEBREW_MONTH_SHORT
+from app.utils.json_utils import atomic_write_json
+
+# Activity type emojis
+ACTIVITY_EMOJIS = {
+    "הסמכה": "🎓",          # Certification
+    "סדנא": "🔧",           # Workshop
+    "הפלגת חברים": "⛵",    # Member Sailing
+    "מודרכת מועדון": "🧭",  # Club Guided
+    "הפלגת מוביל": "🏁"     # Lead Sailing
+}
 
 class ClubMonitor:
     """Monitor for club activity availability changes."""
@@ -17,6 +30,7 @@ class ClubMonitor:
         self.filters = filters or {}
         self.previous_activities = {}
         self.notified_activities = set()
+        self._backoff_attempt = 0
         self.data_dir = Path(__file__).parent.parent / "data"
         self.data_dir.mkdir(exist_ok=True)
         
@@ -47,8 +61,7 @@ class ClubMonitor:
                     if isinstance(loaded_notified, list):
                         self.notified_activities = set(loaded_notified)
                     elif isinstance(loaded_notified, dict):
-                        keys = [self._get_activity_key(item) for item in loaded_notified.values()]
-                        self.notified_activities = {key for key in keys if key}
+                        self.notified_activities = set(filter(None, map(self._get_activity_key, loaded_notified.values())))
                 except json.JSONDecodeError:
                     print("Error loading notified club activities file. Starting fresh.")
     
@@ -65,19 +78,26 @@ class ClubMonitor:
             print("Slack webhook URL not configured. Notifications will not be sent.")
             print("To enable Slack notifications, set SLACK_WEBHOOK_URL or SLACK_WEBHOOK_URL_CLUB in your .env file")
         
-        while True:
-            try:
-                await self.check_for_new_activities()
-                print(f"Next check in {self.interval_seconds // 60} minutes. Waiting...")
-                await asyncio.sleep(self.interval_seconds)
-            except Exception as e:
-                print(f"Error during club monitoring: {e}")
-                print("Retrying in 5 minutes...")
-                await asyncio.sleep(300)
+        try:
+            while True:
+                try:
+                    await self.check_for_new_activities()
+                    self._backoff_attempt = 0
+                    print(f"Next check in {self.interval_seconds // 60} minutes. Waiting...")
+                    await asyncio.sleep(self.interval_seconds)
+                except Exception as e:
+                    print(f"Error during club monitoring: {e}")
+                    # Exponential backoff capped at an hour, with jitter to avoid synchronized retries
+                    delay = min(300 * (2 ** self._backoff_attempt), 3600) + random.uniform(0, 30)
+                    self._backoff_attempt += 1
+                    print(f"Retrying in {delay / 60:.1f} minutes...")
+                    await asyncio.sleep(delay)
+        finally:
+            await self.notifier.aclose()
     
     async def check_for_new_activities(self):
         """Check for newly available club activities."""
-        print(f"Checking for new club activities at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Checking for new club activities at {datetime.now():%Y-%m-%d %H:%M:%S}")
         
         current_activities = await scrape_club_activities_for_days(self.days, self.filters)
         if not current_activities:
@@ -116,16 +136,18 @@ class ClubMonitor:
             print("First run - establishing baseline. No notifications will be sent.")
             print(f"Found {len([a for a in current_activities if a.get('is_available', False)])} available activities to track.")
         
+        # Skip the disk writes when neither activity file would change
+        prev_changed = self.previous_activities != current_activities_dict
+        notified_changed = bool(new_activities)
+        
         # Update previous activities (track ALL activities for next comparison)
         self.previous_activities = current_activities_dict
         
-        # Save previous activities to file
-        with open(self.previous_activities_file, "w", encoding="utf-8") as f:
-            json.dump(self.previous_activities, f, ensure_ascii=False, indent=2)
+        if prev_changed:
+            atomic_write_json(self.previous_activities_file, self.previous_activities, pretty=True)
         
-        # Save notified activities to file
-        with open(self.notified_activities_file, "w", encoding="utf-8") as f:
-            json.dump(list(self.notified_activities), f, ensure_ascii=False, indent=2)
+        if notified_changed:
+            atomic_write_json(self.notified_activities_file, list(self.notified_activities), pretty=True)
         
         if new_activities:
             print(f"Found {len(new_activities)} new available club activities!")
@@ -135,7 +157,7 @@ class ClubMonitor:
     
     async def notify_new_activities(self, new_activities):
         """Send notifications for new club activities."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = f"{datetime.now():%Y%m%d_%H%M%S}"
         notification_file = self.data_dir / f"new_club_activities_{timestamp}.json"
         
         with open(notification_file, "w", encoding="utf-8") as f:
@@ -144,15 +166,19 @@ class ClubMonitor:
         print(f"New club activities saved to {notification_file}")
         
         # Print notification to console
-        print("\n=== NEW AVAILABLE CLUB ACTIVITIES ===")
+        lines = ["\n=== NEW AVAILABLE CLUB ACTIVITIES ==="]
         for activity in new_activities:
-            activity_info = f"Date: {activity['date']}, Time: {activity.get('time', 'Unknown')}"
-            activity_info += f", Type: {activity.get('activity_type', 'Unknown')}"
-            activity_info += f", Boat: {activity.get('boat_name', 'Unknown')}"
+            fields = [
+                f"Date: {activity['date']}",
+                f"Time: {activity.get('time', 'Unknown')}",
+                f"Type: {activity.get('activity_type', 'Unknown')}",
+                f"Boat: {activity.get('boat_name', 'Unknown')}",
+            ]
             if activity.get('activity_name'):
-                activity_info += f", Activity: {activity.get('activity_name')}"
-            print(activity_info)
-        print("=====================================\n")
+                fields.append(f"Activity: {activity.get('activity_name')}")
+            lines.append(", ".join(fields))
+        lines.append("=====================================\n")
+        print("\n".join(lines))
         
         # Send Slack notification using enhanced method
         await self.send_club_slack_notification(new_activities)
@@ -166,15 +192,6 @@ class ClubMonitor:
             print("No webhook URL configured for club notifications")
             return False
         
-        # Activity type emojis
-        activity_emojis = {
-            "הסמכה": "🎓",          # Certification
-            "סדנא": "🔧",           # Workshop  
-            "הפלגת חברים": "⛵",    # Member Sailing
-            "מודרכת מועדון": "🧭",  # Club Guided
-            "הפלגת מוביל": "🏁"     # Lead Sailing
-        }
-        
         total = len(activities)
         lines = [f"🎯 {total} Club Activities"]
         
@@ -185,34 +202,22 @@ class ClubMonitor:
             activity_type = activity.get('activity_type', '')
             activity_name = activity.get('activity_name', '')
             boat_name = activity.get('boat_name', '')
-            emoji = activity_emojis.get(activity_type, "🚣")
+            emoji = ACTIVITY_EMOJIS.get(activity_type, "🚣")
             
             name_to_show = activity_name if activity_name else activity_type
             # Format: "• Fri 12 Dec | 12:00-15:00 | 🎓 Activity (Boat)"
-            line = f"• {short_date} | {time} | {emoji} {name_to_show}"
-            if boat_name:
-                line += f" ({boat_name})"
-            lines.append(line)
+            boat_suffix = f" ({boat_name})" if boat_name else ""
+            lines.append(f"• {short_date} | {time} | {emoji} {name_to_show}{boat_suffix}")
         
         notification = "\n".join(lines)
         webhook_url = self.club_webhook_url or self.slack_webhook_url
-        return self.notifier.send_notification(notification, webhook_url)
+        return await self.notifier.send_notification_async(notification, webhook_url)
     
     def _format_short_date(self, date_str):
         """Convert date to short format like 'Fri 12 Dec'."""
         if not date_str:
             return ""
         
-        hebrew_day_short = {
-            "ראשון": "Sun", "שני": "Mon", "שלישי": "Tue",
-            "רביעי": "Wed", "חמישי": "Thu", "שישי": "Fri", "שבת": "Sat"
-        }
-        hebrew_month_short = {
-            "ינואר": "Jan", "פברואר": "Feb", "מרץ": "Mar", "אפריל": "Apr",
-            "מאי": "May", "יוני": "Jun", "יולי": "Jul", "אוגוסט": "Aug",
-            "ספטמבר": "Sep", "אוקטובר": "Oct", "נובמבר": "Nov", "דצמבר": "Dec"
-        }
-        
         try:
             if "," in date_str:
                 day_name, date_part = date_str.split(",", 1)
@@ -222,8 +227,8 @@ class ClubMonitor:
                 if len(parts) >= 2:
                     day_num = parts[0]
                     month = parts[1]
-                    short_day = hebrew_day_short.get(day_name, day_name[:3])
-                    short_month = hebrew_month_short.get(month, month[:3])
+                    short_day = HEBREW_DAY_SHORT.get(day_name, day_name[:3])
+                    short_month = HEBREW_MONTH_SHORT.get(month, month[:3])
                     return f"{short_day} {day_num} {short_month}"
         except Exception:
             pass
@@ -239,27 +244,14 @@ class ClubMonitor:
         except ValueError:
             pass
         
-        # Hebrew to English day names
-        hebrew_day_to_english = {
-            "ראשון": "Sunday", "שני": "Monday", "שלישי": "Tuesday",
-            "רביעי": "Wednesday", "חמישי": "Thursday", "שישי": "Friday", "שבת": "Saturday"
-        }
-        
-        # Hebrew to English month names
-        hebrew_month_to_english = {
-            "ינואר": "January", "פברואר": "February", "מרץ": "March", "אפריל": "April",
-            "מאי": "May", "יוני": "June", "יולי": "July", "אוגוסט": "August",
-            "ספטמבר": "September", "אוקטובר": "October", "נובמבר": "November", "דצמבר": "December"
-        }
-        
         english_date = hebrew_date
         
         # Replace Hebrew day names with English
-        for hebrew_day, english_day in hebrew_day_to_english.items():
+        for hebrew_day, english_day in HEBREW_DAY_TO_ENGLISH.items():
             english_date = english_date.replace(hebrew_day, english_day)
         
         # Replace Hebrew month names with English
-        for hebrew_month, english_month in hebrew_month_to_english.items():
+        for hebrew_month, english_month in HEBREW_MONTH_NAMES.items():
             english_date = english_date.replace(hebrew_month, english_month)
         
         return english_date
@@ -330,4 +322,5 @@ async def main():
         await monitor.start_monitoring()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
@@ -1,354 +1,564 @@
+import asyncio
+import atexit
+import concurrent.futures
+from collections import defaultdict, deque
+import functools
+import hashlib
+import logging
+import re
 import requests
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
 from typing import List, Dict, Any
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.retry import Retry
+from app.forecasts.swell_forecast import format_slot_forecast, get_simplified_forecast
+from app.utils.date_utils import HEBREW_DAY_TO_ENGLISH, HEBREW_MONTH_NAMES
 from app.utils.boat_categories import group_slots_by_category, get_webhook_for_category
+from app.utils.json_utils import json_dumps
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeout for webhook posts
+_POST_TIMEOUT = (3.05, 10)
+# Identical payloads to the same webhook within this many seconds are not re-posted
+_RESEND_WINDOW = 300
+# Failed posts older than this are dropped instead of redelivered, so nobody gets stale slot alerts
+_DEAD_LETTER_TTL = 3600
+
+# Worker pool shared by every notifier (slot and club monitors), so webhook
+# posts fan out concurrently without each instance owning its own threads
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="slack-notifier")
+
+# Hebrew to English boat names, built once at import
+_HEBREW_BOAT = MappingProxyType({
+    "נאווה 450": "Nava 450",
+    "נאווה": "Nava",
+    "רוני": "Roni",
+    "מסטר 570": "Master 570",
+    "מסטר": "Master",
+    "גולד 470": "Gold 470",
+    "גולד": "Gold",
+    "אסתר": "Esther",
+    "ושתי": "Vashti",
+    "כרמן החדשה": "New Carmen",
+    "ליאור": "Lior",
+    "מישל": "Michel",
+    "קרפה": "Carpe",
+    "רונית": "Ronit",
+    "הרמוני": "Harmony",
+    "קטמנדו": "Katmandu"
+})
+
+_DAY_RE = re.compile(r'(\d+)')
+
+# Month name (Hebrew or English) -> month number, matched in one regex pass
+_MONTH_INDEX = {name: i for i, name in enumerate(HEBREW_MONTH_NAMES.keys(), 1)}
+_MONTH_INDEX.update({name: i for i, name in enumerate(HEBREW_MONTH_NAMES.values(), 1)})
+_MONTH_RE = re.compile("|".join(map(re.escape, _MONTH_INDEX)))
+# "12 אפריל 2025" -> day and month in a single match
+_DATE_RE = re.compile(rf"(?P<day>\d+)\D*?(?P<month>{_MONTH_RE.pattern})")
+
+# Slot table header and rows, with and without the slot-count column
+_TABLE_HEAD_WITH = (
+    "```\n"
+    "| Time          | Boat Type     | Slots |\n"
+    "|---------------|---------------|-------|\n"
+)
+_TABLE_HEAD_NO = (
+    "```\n"
+    "| Time          | Boat Type     |\n"
+    "|---------------|---------------|\n"
+)
+_ROW_FMT_WITH = "| {:<13} | {:<13} | {:<5} |\n".format
+_ROW_FMT_NO = "| {:<13} | {:<13} |\n".format
+
+# Shared between payloads; blocks are only ever serialized, never mutated
+_DIVIDER = {"type": "divider"}
+_FOOTER = {
+    "type": "section",
+    "text": {
+        "type": "mrkdwn",
+        "text": "Book now at <https://yamonline.co.il/|YAM Online>"
+    }
+}
+
+
+def _translate_boat(name: str) -> str:
+    """English name for a Hebrew boat name, or the name unchanged if unknown."""
+    return _HEBREW_BOAT.get(name, name)
+
+
+def _never_sent(exc: Exception) -> bool:
+    """True if a post failed before reaching Slack, so sending it again cannot duplicate a message."""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    # Refused/unreachable connections surface as a ConnectionError wrapping urllib3's MaxRetryError
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _normalize_webhook(url: str) -> str:
+    """Canonical form of a webhook URL so copies that differ only in whitespace or a trailing slash compare equal."""
+    return url.strip().rstrip("/") if url else url
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_slot_forecast(date: str, time: str) -> str:
+    """Forecast emojis for a slot; they only depend on its date and start time."""
+    return format_slot_forecast({"date": date, "time": time})
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_forecast_error():
+    """Forecast error message shown under the slots, if any."""
+    try:
+        _, forecast_error = get_simplified_forecast(days=1)
+    except Exception:
+        return None
+    return forecast_error
+
+
+@functools.lru_cache(maxsize=32)
+def _header_blocks(total_slots: int) -> tuple:
+    """Header, "showing N of M" context and divider that open a slot notification."""
+    return (
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": f"🚣 {total_slots} New Boat Slots Available! 🚣",
+                "emoji": True
+            }
+        },
+        {
+            "type": "context",
+            "elements": [
+                {
+                    "type": "plain_text",
+                    "text": f"(showing 12 of {total_slots})" if total_slots > 12 else " ",
+                    "emoji": True
+                }
+            ]
+        },
+        _DIVIDER
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _translate_date(date: str) -> str:
+    """Convert a Hebrew slot date to the compact English "Day DD.MM" form."""
+    if "," not in date:
+        return date
+    
+    parts = date.split(",", 1)
+    day_name = parts[0].strip()
+    date_part = parts[1].strip()
+    
+    # Convert day name
+    english_day = HEBREW_DAY_TO_ENGLISH.get(day_name, day_name)
+    
+    # Extract day and month from the date string in one pass
+    date_match = _DATE_RE.search(date_part)
+    if date_match:
+        day_num = date_match.group("day")
+        month_num = _MONTH_INDEX[date_match.group("month")]
+    else:
+        day_match = _DAY_RE.search(date_part)
+        day_num = day_match.group(1) if day_match else ""
+        
+        # Find which month is in the string (default to January if not found)
+        month_match = _MONTH_RE.search(date_part)
+        month_num = _MONTH_INDEX[month_match.group(0)] if month_match else 1
+    
+    # Format as "Day DD.MM" (e.g., "Friday 11.04")
+    return f"{english_day} {day_num.zfill(2)}.{month_num:02d}"
+
+
+@functools.lru_cache(maxsize=128)
+def _render_mobile_text(total_slots: int, rows: tuple, forecast_error: str) -> str:
+    """Render the mobile notification text from (date, ((time, boat, emoji), ...)) rows."""
+    # Format the notification
+    out = [f"🚣 {total_slots} New Boat Slots Available! 🚣"]
+    
+    # Show message about limiting displayed slots if needed
+    shown_slots = min(total_slots, 12)  # Show up to 12 slots
+    if total_slots > shown_slots:
+        out.append(f" (showing {shown_slots} of {total_slots})")
+    
+    # Add slots by date
+    out.append("\n\n")
+    for date, date_rows in rows:
+        out.append(f"{_translate_date(date)}:\n")
+        for time, boat_name, forecast_emoji in date_rows:
+            # Add forecast emoji if available (only if no error)
+            if forecast_emoji and not forecast_error:
+                out.append(f"- {time}: {boat_name} {forecast_emoji}\n")
+            else:
+                out.append(f"- {time}: {boat_name}\n")
+        out.append("\n")
+    
+    # Add forecast error at the end if present
+    if forecast_error:
+        out.append(f"\n{forecast_error}")
+    
+    return "".join(out).strip()
+
 
 class SlackNotifier:
     def __init__(self, webhook_url: str = None, category_webhooks: Dict[str, str] = None):
         self.webhook_url = webhook_url
         self.category_webhooks = category_webhooks or {}
+        # Long-lived session so repeated posts reuse the keep-alive TLS connection;
+        # the default and category webhooks all live on hooks.slack.com and share the pool
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        # Connect errors and transient 429/5xx responses are retried with backoff on the same
+        # kept-alive connection. Read timeouts are not: Slack may already have accepted the
+        # post, and webhook posts aren't idempotent, so a retry could duplicate the message.
+        retry = Retry(
+            total=3,
+            read=False,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True
+        )
+        self._session.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=8))
+        # Posts are queued on the shared worker pool so callers never wait on Slack;
+        # anything still pending is flushed before the interpreter exits
+        self._pending = set()
+        atexit.register(self.flush)
+        # (webhook, slot-set fingerprint) of recent deliveries, to avoid re-posting identical notifications
+        self._recent_hashes = deque(maxlen=16)
+        # (webhook, payload digest) -> time of the last successful post, guarded for the worker threads
+        self._recent_sends = {}
+        self._recent_sends_lock = threading.Lock()
+        # (time queued, redelivery callable) for posts that never reached Slack, redelivered on the
+        # next send. Kept in memory only, so this helps the long-running monitor, not --once runs
+        self._dead_letters = deque(maxlen=100)
+        # Category webhooks are resolved once; ones equal to the default are dropped
+        # so single-channel setups never categorize slots at all
+        default_webhook = _normalize_webhook(webhook_url)
+        self._category_targets = {}
+        for category in ("katamaran", "monohull"):
+            webhook = _normalize_webhook(self.category_webhooks.get(category) or get_webhook_for_category(category))
+            if webhook and webhook != default_webhook:
+                self._category_targets[category] = webhook
+    
+    def _submit(self, fn, *args) -> concurrent.futures.Future:
+        future = _EXECUTOR.submit(fn, *args)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+    
+    def flush(self):
+        """Block until every queued notification has been posted."""
+        while self._pending:
+            concurrent.futures.wait(self._pending.copy())
+    
+    def close(self):
+        """Flush queued notifications and release the pooled HTTP connections."""
+        self.flush()
+        self._session.close()
+    
+    async def aclose(self):
+        """close() for async callers; waiting on queued posts happens off the event loop."""
+        await asyncio.to_thread(self.close)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def send_notification(self, message: str, webhook_url: str = None) -> bool:
-        target_webhook = webhook_url or self.webhook_url
+        target_webhook = self._message_target(message, webhook_url)
+        if not target_webhook:
+            return False
         
+        self._submit(self._post_message, message, target_webhook)
+        return True
+    
+    async def send_notification_async(self, message: str, webhook_url: str = None) -> bool:
+        """Send a plain text notification and wait for the post without blocking the event loop."""
+        target_webhook = self._message_target(message, webhook_url)
         if not target_webhook:
-            print(f"Slack notification not sent (webhook URL not configured): {message}")
             return False
-            
+        
+        return await asyncio.to_thread(self._post_message, message, target_webhook)
+    
+    def _message_target(self, message: str, webhook_url: str = None):
+        """Webhook a plain text message goes to, or None if none is configured.
+
+        Shared by the sync and async senders; queues redelivery of earlier failed posts.
+        """
+        target_webhook = webhook_url or self.webhook_url
+        
+        if not target_webhook:
+            logger.warning("Slack notification not sent (webhook URL not configured): %s", message)
+            return None
+        
+        self._schedule_redelivery()
+        return target_webhook
+    
+    def _post_message(self, message: str, target_webhook: str) -> bool:
         payload = {
             "text": message
         }
+        body = json_dumps(payload)
         
+        response = self._post(
+            body, target_webhook, "Slack notification",
+            functools.partial(self._post_message, message, target_webhook)
+        )
+        if response is not None and response.status_code == 200 and response.text == "ok":
+            logger.info("Slack notification sent successfully")
+            return True
+        if response is not None:
+            logger.error("Failed to send Slack notification: %s %s", response.status_code, response.text)
+        logger.info("Message that would have been sent: %s", message)
+        return False
+    
+    def _post(self, body: bytes, webhook_url: str, label: str, redeliver):
+        """POST a body to a webhook; returns the response, or None if the request failed.
+
+        Failures that never reached Slack are queued so redeliver() runs on the next send.
+        Read timeouts are not, since Slack may already have accepted the post.
+        """
         try:
-            response = requests.post(
-                target_webhook,
-                json=payload,
-                headers={"Content-Type": "application/json"}
+            return self._session.post(
+                webhook_url,
+                data=body,
+                timeout=_POST_TIMEOUT
             )
-            if response.status_code == 200 and response.text == "ok":
-                print("Slack notification sent successfully")
-                return True
-            else:
-                print(f"Failed to send Slack notification: {response.status_code} {response.text}")
-                print(f"Message that would have been sent: {message}")
-                return True
+        except requests.exceptions.ReadTimeout:
+            logger.warning("%s timed out waiting for a response, not re-sending: %s", label.capitalize(), webhook_url)
         except Exception as e:
-            print(f"Error sending Slack notification: {e}")
-            print(f"Message that would have been sent: {message}")
-            return True
+            if _never_sent(e):
+                logger.warning("Could not connect to Slack, queued the %s for redelivery: %s", label, webhook_url)
+                self._dead_letter(redeliver)
+            else:
+                logger.exception("Error sending %s", label)
+        return None
     
-    def send_slot_notification(self, slots: List[Dict[str, Any]]) -> bool:
+    async def send_slot_notification_async(self, slots: List[Dict[str, Any]]) -> bool:
+        """Send a slot notification and wait for every webhook post to finish.
+
+        Formatting and each post run in worker threads, so the event loop stays
+        free while the posts to all webhooks are in flight together.
+        """
         if not slots:
             return False
         
-        # Send to default webhook (all slots)
-        if self.webhook_url:
-            self._send_formatted_notification(slots, self.webhook_url)
-        
-        # Group slots by boat category
-        categorized_slots = group_slots_by_category(slots)
+        targets = self._resolve_targets(slots)
+        if not targets:
+            logger.warning("Slack notification not sent (webhook URL not configured): %d new slots", len(slots))
+            return False
         
-        # Send category-specific notifications
-        for category in ["katamaran", "monohull"]:
-            category_slots = categorized_slots.get(category, [])
-            if category_slots:
-                webhook = get_webhook_for_category(category)
-                if webhook and webhook != self.webhook_url:  # Don't duplicate if same as default
-                    self._send_formatted_notification(category_slots, webhook)
+        # Dedupe per webhook, so one that failed still gets the next identical send
+        # while the ones that already accepted it are skipped
+        sent_keys = {webhook: (webhook, self._hash_slots(target_slots)) for webhook, target_slots in targets.items()}
+        targets = {webhook: target_slots for webhook, target_slots in targets.items() if sent_keys[webhook] not in self._recent_hashes}
+        if not targets:
+            logger.info("Skipping Slack notification: the same %d slots were already sent", len(slots))
+            return True
         
-        return True
+        self._schedule_redelivery()
+        bodies = await asyncio.to_thread(self._serialize_slot_payloads, targets)
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._post_slot_payload, body, webhook)
+            for webhook, body in bodies.items()
+        ))
+        for webhook, sent in zip(bodies, results):
+            if sent and sent_keys[webhook] not in self._recent_hashes:
+                self._recent_hashes.append(sent_keys[webhook])
+        return all(results)
     
-    def _format_mobile_notification(self, slots: List[Dict[str, Any]]) -> str:
-        # Format the notification
-        total_slots = len(slots)
-        notification = f"🚣 {total_slots} New Boat Slots Available! 🚣"
-        
-        # Show message about limiting displayed slots if needed
-        shown_slots = min(len(slots), 12)  # Show up to 12 slots
-        if len(slots) > shown_slots:
-            notification += f" (showing {shown_slots} of {len(slots)})"
+    def _schedule_redelivery(self):
+        if self._dead_letters:
+            self._submit(self._redeliver_dead_letters)
+    
+    def _dead_letter(self, redeliver):
+        self._dead_letters.append((time.monotonic(), redeliver))
+    
+    def _redeliver_dead_letters(self):
+        """Retry posts that never reached Slack; ones that fail to connect again are re-queued."""
+        logger.info("Redelivering %d failed Slack posts", len(self._dead_letters))
+        cutoff = time.monotonic() - _DEAD_LETTER_TTL
+        for _ in range(len(self._dead_letters)):
+            try:
+                queued_at, redeliver = self._dead_letters.popleft()
+            except IndexError:
+                break
+            if queued_at < cutoff:
+                logger.info("Dropping a failed Slack post queued more than %d minutes ago", _DEAD_LETTER_TTL // 60)
+                continue
+            redeliver()
+    
+    def _resolve_targets(self, slots: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        # Default webhook gets all slots
+        targets = {}
+        default_webhook = _normalize_webhook(self.webhook_url)
+        if default_webhook:
+            targets[default_webhook] = slots
         
-        # Group slots by date for cleaner presentation
-        slots_by_date = {}
+        if self._category_targets:
+            # Group slots by boat category
+            categorized_slots = group_slots_by_category(slots)
+            for category, webhook in self._category_targets.items():
+                category_slots = categorized_slots.get(category, [])
+                if category_slots:
+                    # Categories sharing a webhook get a single combined message
+                    targets.setdefault(webhook, []).extend(category_slots)
         
-        from app.forecasts.swell_forecast import format_slot_forecast
+        return targets
+    
+    @staticmethod
+    def _hash_slots(slots: List[Dict[str, Any]]) -> bytes:
+        fingerprint = sorted(
+            (str(slot.get("date", "")), str(slot.get("time", "")), str(slot.get("service_type", "")), str(slot.get("slots", 1)))
+            for slot in slots
+        )
+        return hashlib.blake2b(json_dumps(fingerprint), digest_size=16).digest()
+    
+    def _serialize_slot_payloads(self, targets: Dict[str, List[Dict[str, Any]]]) -> Dict[str, bytes]:
+        # Forecast data may have been refreshed since the last notification
+        _cached_slot_forecast.cache_clear()
+        _cached_forecast_error.cache_clear()
         
+        # Format and serialize each distinct slot list once
+        bodies = {}
+        by_slot_list = {}
+        for webhook, target_slots in targets.items():
+            key = id(target_slots)
+            if key not in by_slot_list:
+                by_slot_list[key] = json_dumps(self._build_slot_payload(target_slots))
+            bodies[webhook] = by_slot_list[key]
+        return bodies
+    
+    def _prepare(self, slots: List[Dict[str, Any]]):
+        """Group the shown slots by date with translated boat names and forecast emojis.
+
+        Both the mobile text and the blocks are rendered from this, so each
+        slot is translated and looked up in the forecast only once.
+        """
         # Get forecast error if any
-        forecast_error = None
-        try:
-            from app.forecasts.swell_forecast import get_simplified_forecast
-            _, forecast_error = get_simplified_forecast(days=1)
-        except Exception:
-            pass
-        
-        for slot in slots[:shown_slots]:  # Only process slots we'll show
-            date_key = slot.get("date", "Unknown")
-            if date_key not in slots_by_date:
-                slots_by_date[date_key] = []
-            
-            # Format the slot info
-            service_type = slot.get('service_type', '')
-            
-            # Map Hebrew boat names to English if needed
-            hebrew_boat_to_english = {
-                "נאווה 450": "Nava 450",
-                "נאווה": "Nava",
-                "רוני": "Roni",
-                "מסטר 570": "Master 570",
-                "מסטר": "Master",
-                "גולד 470": "Gold 470",
-                "גולד": "Gold",
-                "אסתר": "Esther",
-                "ושתי": "Vashti",
-                "כרמן החדשה": "New Carmen",
-                "ליאור": "Lior",
-                "מישל": "Michel",
-                "קרפה": "Carpe",
-                "רונית": "Ronit",
-                "הרמוני": "Harmony",
-                "קטמנדו": "Katmandu"
-            }
-            
-            # Convert boat name to English if possible
-            if service_type in hebrew_boat_to_english:
-                service_type = hebrew_boat_to_english[service_type]
-            
-            slot_info = f"{slot.get('time', '')}: {service_type}"
-            
-            # Add forecast emoji if available (only if no error)
-            if not forecast_error:
-                forecast_emoji = format_slot_forecast(slot)
-                if forecast_emoji:
-                    slot_info += f" {forecast_emoji}"
-                
-            slots_by_date[date_key].append(slot_info)
+        forecast_error = _cached_forecast_error()
         
-        # Add slots by date
-        notification += "\n\n"
-        for date, slot_infos in slots_by_date.items():
-            # Convert Hebrew date format to English completely
-            if "," in date:
-                parts = date.split(",", 1)
-                day_name = parts[0].strip()
-                date_part = parts[1].strip()
-                
-                # Map Hebrew day names to English
-                hebrew_day_to_english = {
-                    "ראשון": "Sunday",
-                    "שני": "Monday",
-                    "שלישי": "Tuesday",
-                    "רביעי": "Wednesday",
-                    "חמישי": "Thursday",
-                    "שישי": "Friday",
-                    "שבת": "Saturday"
-                }
-                
-                # Map Hebrew month names to English
-                hebrew_month_to_english = {
-                    "ינואר": "January",
-                    "פברואר": "February",
-                    "מרץ": "March",
-                    "אפריל": "April",
-                    "מאי": "May",
-                    "יוני": "June",
-                    "יולי": "July",
-                    "אוגוסט": "August",
-                    "ספטמבר": "September",
-                    "אוקטובר": "October",
-                    "נובמבר": "November",
-                    "דצמבר": "December"
-                }
-                
-                # Convert day name
-                english_day = hebrew_day_to_english.get(day_name, day_name)
-                
-                # Try to parse the date to create a compact format
-                try:
-                    import re
-                    
-                    # Extract day and month from the date string
-                    day_match = re.search(r'(\d+)', date_part)
-                    day_num = day_match.group(1) if day_match else ""
-                    
-                    # Find which month is in the string
-                    month_num = 1  # Default to January if not found
-                    for i, (hebrew_month, english_month) in enumerate(hebrew_month_to_english.items(), 1):
-                        if hebrew_month in date_part or english_month in date_part:
-                            month_num = i
-                            break
-                    
-                    # Format as "Day DD.MM" (e.g., "Friday 11.04")
-                    date = f"{english_day} {day_num.zfill(2)}.{str(month_num).zfill(2)}"
-                except Exception:
-                    # Fallback: Convert month name if present
-                    for hebrew_month, english_month in hebrew_month_to_english.items():
-                        if hebrew_month in date_part:
-                            date_part = date_part.replace(hebrew_month, english_month)
-                    
-                    # Reconstruct the date in English
-                    date = f"{english_day}, {date_part}"
+        # Group the slots we'll show (up to 12) by date, noting which dates
+        # have a slot with a count greater than 1
+        slots_by_date = defaultdict(list)
+        multi_slot_dates = set()
+        for slot in slots[:12]:
+            date = slot.get("date", "Unknown")
+            if slot.get("slots", 1) > 1:
+                multi_slot_dates.add(date)
             
-            notification += f"{date}:\n"
-            for slot_info in slot_infos:
-                notification += f"- {slot_info}\n"
+            boat_name = _translate_boat(slot.get('service_type', ''))
             
-            notification += "\n"
-        
-        # Add forecast error at the end if present
-        if forecast_error:
-            notification += f"\n{forecast_error}"
+            forecast_emoji = _cached_slot_forecast(date, slot.get("time", ""))
+            slots_by_date[date].append((slot, boat_name, forecast_emoji))
         
-        return notification.strip()
+        return len(slots), slots_by_date, multi_slot_dates, forecast_error
     
-    def _send_formatted_notification(self, slots: List[Dict[str, Any]], webhook_url: str) -> bool:
-        if not webhook_url:
-            print(f"Slack notification not sent (webhook URL not configured): {len(slots)} new slots")
-            return False
-        
-        # Limit total slots to 12
-        total_slots = len(slots)
-        slots_to_show = slots[:12] if total_slots > 12 else slots
+    def _format_mobile_notification(self, prepared) -> str:
+        total_slots, slots_by_date, _, forecast_error = prepared
         
-        # Create a mobile-friendly notification summary
-        mobile_notification = self._format_mobile_notification(slots)
-        
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"🚣 {total_slots} New Boat Slots Available! 🚣",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "plain_text",
-                        "text": f"(showing 12 of {total_slots})" if total_slots > 12 else " ",
-                        "emoji": True
-                    }
-                ]
-            },
-            {
-                "type": "divider"
-            }
-        ]
-        
-        # Import swell forecast functions
-        from app.forecasts.swell_forecast import format_slot_forecast
+        # Only the rendered fields go into the key, so the cached text is
+        # reused whenever a scrape yields the same slots and forecasts
+        rows = tuple(
+            (date, tuple((slot.get('time', ''), boat_name, forecast_emoji)
+                         for slot, boat_name, forecast_emoji in date_rows))
+            for date, date_rows in slots_by_date.items()
+        )
+        return _render_mobile_text(total_slots, rows, forecast_error)
+    
+    def _build_blocks(self, prepared) -> List[Dict[str, Any]]:
+        total_slots, slots_by_date, multi_slot_dates, _ = prepared
         
-        # Group slots by date
-        slots_by_date = {}
-        for slot in slots_to_show:
-            date = slot.get("date", "Unknown")
-            if date not in slots_by_date:
-                slots_by_date[date] = []
-            slots_by_date[date].append(slot)
+        blocks = list(_header_blocks(total_slots))
         
         # Add each date section with its slots
-        for date, date_slots in slots_by_date.items():
-            # Get swell forecast for this date using the first slot
-            swell_info = format_slot_forecast(date_slots[0])
+        for date, date_rows in slots_by_date.items():
+            # Swell forecast for this date comes from the first slot
+            swell_info = date_rows[0][2]
             
-            # Add date header with swell info
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*📅 {date}*  |  *🌊 Swell:* {swell_info}"
-                }
-            })
+            has_multiple_slots = date in multi_slot_dates
             
-            # Check if any slot has a count greater than 1
-            has_multiple_slots = any(slot.get("slots", 1) > 1 for slot in date_slots)
+            # Time, boat type (with forecast emoji if available) and slot count per row
+            cells = [
+                (slot.get("time", "Unknown"),
+                 f"{boat_name} {forecast_emoji}" if forecast_emoji else boat_name,
+                 slot.get("slots", 1))
+                for slot, boat_name, forecast_emoji in date_rows
+            ]
             
             # Create a table for this date's slots
-            table_text = "```\n"
             if has_multiple_slots:
-                table_text += "| Time          | Boat Type     | Slots |\n"
-                table_text += "|---------------|---------------|-------|\n"
+                table_text = "".join((_TABLE_HEAD_WITH, *(_ROW_FMT_WITH(*cell) for cell in cells), "```"))
             else:
-                table_text += "| Time          | Boat Type     |\n"
-                table_text += "|---------------|---------------|\n"
-            
-            for slot in date_slots:
-                time = slot.get("time", "Unknown")
-                service_type = slot.get('service_type', '')
-                
-                # Map Hebrew boat names to English if needed
-                hebrew_boat_to_english = {
-                    "נאווה 450": "Nava 450",
-                    "נאווה": "Nava",
-                    "רוני": "Roni",
-                    "מסטר 570": "Master 570",
-                    "מסטר": "Master",
-                    "גולד 470": "Gold 470",
-                    "גולד": "Gold"
-                }
-                
-                # Convert boat name to English if possible
-                if service_type in hebrew_boat_to_english:
-                    service_type = hebrew_boat_to_english[service_type]
-                    
-                boat_type = service_type
-                
-                # Add forecast emoji if available
-                forecast_emoji = format_slot_forecast(slot)
-                if forecast_emoji:
-                    boat_type += f" {forecast_emoji}"
-                
-                slots_count = slot.get("slots", 1)
-                
-                if has_multiple_slots:
-                    table_text += f"| {time.ljust(13)} | {boat_type.ljust(13)} | {str(slots_count).ljust(5)} |\n"
-                else:
-                    table_text += f"| {time.ljust(13)} | {boat_type.ljust(13)} |\n"
+                table_text = "".join((_TABLE_HEAD_NO, *(_ROW_FMT_NO(time, boat_type) for time, boat_type, _ in cells), "```"))
             
-            table_text += "```"
-            
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": table_text
-                }
-            })
-            
-            blocks.append({
-                "type": "divider"
-            })
+            # Date header with swell info, the slot table, then a divider
+            blocks.extend((
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": f"*📅 {date}*  |  *🌊 Swell:* {swell_info}"
+                    }
+                },
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": table_text
+                    }
+                },
+                _DIVIDER
+            ))
         
         # Add footer with link
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "Book now at <https://yamonline.co.il/|YAM Online>"
-            }
-        })
+        blocks.append(_FOOTER)
+        
+        return blocks
+    
+    def _build_slot_payload(self, slots: List[Dict[str, Any]]) -> Dict[str, Any]:
+        prepared = self._prepare(slots)
         
         # Use mobile-friendly text for notification preview
-        payload = {
-            "text": mobile_notification,
-            "blocks": blocks
+        return {
+            "text": self._format_mobile_notification(prepared),
+            "blocks": self._build_blocks(prepared)
         }
-        
-        try:
-            response = requests.post(
-                webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
-            if response.status_code == 200 and response.text == "ok":
-                print("New slot notification sent successfully")
-                return True
-            else:
-                print(f"Failed to send slot notification: {response.status_code} {response.text}")
+    
+    def _post_slot_payload(self, body: bytes, webhook_url: str) -> bool:
+        send_key = (webhook_url, hashlib.blake2b(body, digest_size=16).digest())
+        with self._recent_sends_lock:
+            # Forget sends that have aged out of the window
+            cutoff = time.monotonic() - _RESEND_WINDOW
+            for key in [key for key, sent_at in self._recent_sends.items() if sent_at < cutoff]:
+                del self._recent_sends[key]
+            if send_key in self._recent_sends:
+                logger.info("Skipping slot notification: identical payload already sent to %s", webhook_url)
                 return True
-        except Exception as e:
-            print(f"Error sending slot notification: {e}")
+        
+        response = self._post(
+            body, webhook_url, "slot notification",
+            functools.partial(self._post_slot_payload, body, webhook_url)
+        )
+        if response is None:
+            return False
+        if response.status_code == 200 and response.text == "ok":
+            logger.info("New slot notification sent successfully")
+            with self._recent_sends_lock:
+                self._recent_sends[send_key] = time.monotonic()
             return True
+        logger.error("Failed to send slot notification: %s %s", response.status_code, response.text)
+        return False
 
 
 def setup_instructions():
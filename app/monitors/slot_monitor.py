@@ -1,14 +1,19 @@
 import asyncio
 import json
+import logging
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from app.scrapers.cookie_scraper import scrape_calendar_slots_for_days
+from app.scrapers.cookie_scraper import AuthenticationError, iter_calendar_slots_for_days
 from app.monitors.slack_notifier import SlackNotifier, setup_instructions
 from app.utils.merge_slots import merge_consecutive_slots, format_merged_slots_for_notification
 from app.utils.slot_filter_config import load_slot_filters
 from app.utils.slot_filter import filter_slots_by_conditions
+from app.utils.date_utils import parse_hebrew_date
+from app.utils.json_utils import atomic_write_json, json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
 
 class SlotMonitor:
     def __init__(self, slack_webhook_url=None, days=14, interval_minutes=30, filters=None):
@@ -34,191 +39,184 @@ class SlotMonitor:
         # Load previous slots if available
         self.previous_slots_file = self.data_dir / "previous_slots.json"
         if self.previous_slots_file.exists():
-            with open(self.previous_slots_file, "r", encoding="utf-8") as f:
+            with open(self.previous_slots_file, "rb") as f:
                 try:
-                    self.previous_slots = json.load(f)
+                    self.previous_slots = json_loads(f.read())
                 except json.JSONDecodeError:
-                    print("Error loading previous slots file. Starting fresh.")
+                    logger.warning("Error loading previous slots file. Starting fresh.")
         
         # Load notified slots if available
         self.notified_slots_file = self.data_dir / "notified_slots.json"
         if self.notified_slots_file.exists():
-            with open(self.notified_slots_file, "r", encoding="utf-8") as f:
+            with open(self.notified_slots_file, "rb") as f:
                 try:
-                    self.notified_slots = set(json.load(f))
+                    self.notified_slots = set(json_loads(f.read()))
                 except json.JSONDecodeError:
-                    print("Error loading notified slots file. Starting fresh.")
+                    logger.warning("Error loading notified slots file. Starting fresh.")
     
     async def start_monitoring(self):
-        print(f"Starting slot monitoring every {self.interval_seconds // 60} minutes for {self.days} days ahead")
+        logger.info("Starting slot monitoring every %d minutes for %d days ahead", self.interval_seconds // 60, self.days)
         if self.filters:
             filter_desc = ", ".join(f"{k}: {v}" for k, v in self.filters.items())
-            print(f"Using filters: {filter_desc}")
+            logger.info("Using filters: %s", filter_desc)
         
         if self.slack_webhook_url:
-            self.notifier.send_notification("YAM Slot Monitor started. Monitoring for new available slots...")
+            await self.notifier.send_notification_async("YAM Slot Monitor started. Monitoring for new available slots...")
         else:
-            print("Slack webhook URL not configured. Notifications will not be sent.")
-            print("To enable Slack notifications, run 'python -m app.main monitor setup'")
+            logger.warning("Slack webhook URL not configured. Notifications will not be sent.")
+            logger.warning("To enable Slack notifications, run 'python -m app.main monitor setup'")
         
-        while True:
-            try:
-                await self.check_for_new_slots()
-                print(f"Next check in {self.interval_seconds // 60} minutes. Waiting...")
-                await asyncio.sleep(self.interval_seconds)
-            except Exception as e:
-                print(f"Error during monitoring: {e}")
-                print("Retrying in 5 minutes...")
-                await asyncio.sleep(300)
+        try:
+            while True:
+                try:
+                    await self.check_for_new_slots()
+                    logger.info("Next check in %d minutes. Waiting...", self.interval_seconds // 60)
+                    await asyncio.sleep(self.interval_seconds)
+                except Exception:
+                    logger.exception("Error during monitoring. Retrying in 5 minutes...")
+                    await asyncio.sleep(300)
+        finally:
+            await self.notifier.aclose()
     
     async def check_for_new_slots(self):
-        print(f"Checking for new slots at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        now = datetime.now()
+        logger.info("Checking for new slots at %s", now.replace(microsecond=0))
         
-        current_slots = await scrape_calendar_slots_for_days(self.days, self.filters)
-        if not current_slots:
-            print("Failed to retrieve current slots")
+        # Convert ALL current slots to a dict (not just available ones)
+        # This allows proper tracking of availability state changes.
+        # extract_slots_from_page always sets is_available, so it can be indexed directly below.
+        try:
+            current_slots_dict = {
+                slot['date'] + '_' + str(slot['event_id']) + '_' + str(slot.get('time', '')): slot
+                async for slot in iter_calendar_slots_for_days(self.days, self.filters)
+            }
+        except AuthenticationError:
+            logger.warning("Failed to retrieve current slots: could not authenticate")
             return
         
-        new_slots = []
+        # Keep the previous state as is, so slots aren't all reported as new once the calendar fills again
+        if not current_slots_dict:
+            logger.info("No slots found in the calendar")
+            return
         
-        # Convert ALL current slots to a dict (not just available ones)
-        # This allows proper tracking of availability state changes
-        current_slots_dict = {}
-        for slot in current_slots:
-            slot_key = f"{slot['date']}_{slot['event_id']}_{slot.get('time', '')}"
-            current_slots_dict[slot_key] = slot
+        # Forget notified slots whose date has already passed so the set doesn't grow forever
+        pruned = self._prune_past_notified_slots(now.date())
         
-        # Find slots that are now available
-        for slot_key, slot in current_slots_dict.items():
-            if not slot.get('is_available', False):
-                continue
-            
-            if slot_key in self.notified_slots:
-                continue
-            
-            if slot_key not in self.previous_slots:
-                # Completely new slot that is available
-                new_slots.append(slot)
-                self.notified_slots.add(slot_key)
-            else:
-                # Slot existed before - check if it became available
-                prev_slot = self.previous_slots[slot_key]
-                if not prev_slot.get('is_available', False):
-                    new_slots.append(slot)
-                    self.notified_slots.add(slot_key)
+        # Find slots that are now available: either completely new, or existed before and just
+        # became available. Both cases are "available now but not before", minus what was already notified.
+        available_keys = {key for key, slot in current_slots_dict.items() if slot['is_available']}
+        prev_available_keys = {key for key, slot in self.previous_slots.items() if slot.get('is_available', False)}
+        new_keys = available_keys - prev_available_keys - self.notified_slots
+        self.notified_slots |= new_keys
+        # Keep the scraper's ordering for the notification
+        new_slots = [slot for key, slot in current_slots_dict.items() if key in new_keys]
+        
+        # Only rewrite state files that actually changed since the last cycle
+        prev_changed = self.previous_slots != current_slots_dict
+        notified_changed = bool(new_slots) or pruned
         
         # Update previous slots with ALL slots (available and unavailable)
         self.previous_slots = current_slots_dict
         
         # Save previous slots to file
-        with open(self.previous_slots_file, "w", encoding="utf-8") as f:
-            json.dump(self.previous_slots, f, ensure_ascii=False, indent=2)
+        if prev_changed:
+            atomic_write_json(self.previous_slots_file, self.previous_slots)
         
         # Save notified slots to file
-        with open(self.notified_slots_file, "w", encoding="utf-8") as f:
-            json.dump(list(self.notified_slots), f, ensure_ascii=False, indent=2)
+        if notified_changed:
+            atomic_write_json(self.notified_slots_file, list(self.notified_slots))
         
         if new_slots:
-            print(f"Found {len(new_slots)} new available slots!")
+            logger.info("Found %d new available slots!", len(new_slots))
             
             # Filter out slots from the last day (14th day)
             if self.days > 1:
                 # Calculate the date of the last day
-                last_day = datetime.now() + timedelta(days=self.days-1)
-                last_day_formatted = last_day.strftime("%Y-%m-%d")
+                last_day = (now + timedelta(days=self.days-1)).date()
                 
                 # Filter slots to exclude the last day
                 filtered_new_slots = []
                 excluded_count = 0
                 
                 for slot in new_slots:
-                    slot_date = slot.get("date", "")
+                    # Parse Hebrew date format (e.g., "שישי, 12 אפריל 2025");
+                    # if we can't parse the date, include the slot to be safe
+                    slot_date = parse_hebrew_date(slot.get("date", ""))
                     
-                    # Check if this is from the last day by trying to parse the date
-                    try:
-                        # Parse Hebrew date format (e.g., "שישי, 12 אפריל 2025")
-                        hebrew_month_names = {
-                            "ינואר": "January", "פברואר": "February", "מרץ": "March",
-                            "אפריל": "April", "מאי": "May", "יוני": "June",
-                            "יולי": "July", "אוגוסט": "August", "ספטמבר": "September",
-                            "אוקטובר": "October", "נובמבר": "November", "דצמבר": "December"
-                        }
-                        
-                        if "," in slot_date:
-                            day_name, date_part = slot_date.split(",", 1)
-                            date_part = date_part.strip()
-                            
-                            parts = date_part.split()
-                            if len(parts) >= 3:  # day, month, year
-                                day_num = parts[0]
-                                month_name = parts[1]
-                                year = parts[2]
-                                
-                                # Translate Hebrew month name if needed
-                                if month_name in hebrew_month_names:
-                                    month_name = hebrew_month_names[month_name]
-                                
-                                # Parse the date
-                                date_obj = datetime.strptime(f"{day_num} {month_name} {year}", "%d %B %Y")
-                                slot_date_formatted = date_obj.strftime("%Y-%m-%d")
-                                
-                                # Skip if it's the last day
-                                if slot_date_formatted == last_day_formatted:
-                                    excluded_count += 1
-                                    continue
-                    except Exception:
-                        # If we can't parse the date, include the slot to be safe
-                        pass
+                    # Skip if it's the last day
+                    if slot_date == last_day:
+                        excluded_count += 1
+                        continue
                     
                     filtered_new_slots.append(slot)
                 
                 if excluded_count > 0:
-                    print(f"Excluded {excluded_count} slots from the {self.days}th day from notifications")
+                    logger.info("Excluded %d slots from the %dth day from notifications", excluded_count, self.days)
                 
                 await self.notify_new_slots(filtered_new_slots)
             else:
                 await self.notify_new_slots(new_slots)
         else:
-            print("No new slots found")
+            logger.info("No new slots found")
+    
+    def _prune_past_notified_slots(self, today):
+        """Drop notified slot keys dated before today. Returns True if any were removed."""
+        expired = set()
+        is_past = {}  # many keys share a date, so parse each date prefix once
+        for slot_key in self.notified_slots:
+            # Keys look like "<hebrew date>_<event id>_<time>"; keep anything we can't parse
+            date_str = slot_key.partition('_')[0]
+            past = is_past.get(date_str)
+            if past is None:
+                slot_date = parse_hebrew_date(date_str)
+                past = is_past[date_str] = slot_date is not None and slot_date < today
+            if past:
+                expired.add(slot_key)
+        
+        if expired:
+            self.notified_slots -= expired
+            logger.info("Pruned %d notified slots from past dates", len(expired))
+        return bool(expired)
     
     async def notify_new_slots(self, new_slots):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = f"{datetime.now():%Y%m%d_%H%M%S}"
         notification_file = self.data_dir / f"new_slots_{timestamp}.json"
         
-        with open(notification_file, "w", encoding="utf-8") as f:
-            json.dump(new_slots, f, ensure_ascii=False, indent=2)
+        with open(notification_file, "wb") as f:
+            f.write(json_dumps(new_slots, pretty=True))
         
-        print(f"New slots saved to {notification_file}")
+        logger.info("New slots saved to %s", notification_file)
         
         # Apply slot filters (weather + days ahead)
         slot_filter_config = load_slot_filters()
         filtered_slots, filter_log = filter_slots_by_conditions(new_slots, slot_filter_config)
         if filter_log:
-            print("\n=== SLOT FILTERING ===")
-            for entry in filter_log:
-                print(entry)
-            print(f"Passed: {len(filtered_slots)}/{len(new_slots)} slots")
-            print("======================\n")
+            logger.info(
+                "\n=== SLOT FILTERING ===\n%s\nPassed: %d/%d slots\n======================\n",
+                "\n".join(filter_log), len(filtered_slots), len(new_slots),
+            )
         
         if not filtered_slots:
-            print("All slots were filtered out. No notification sent.")
+            logger.info("All slots were filtered out. No notification sent.")
             return
         
         # Merge consecutive slots for the same boat
         merged_slots = merge_consecutive_slots(filtered_slots)
         formatted_slots = format_merged_slots_for_notification(merged_slots)
         
-        # Print notification to console
-        print("\n=== NEW AVAILABLE SLOTS ===")
-        for slot in formatted_slots:
-            slot_info = f"Date: {slot['date']}, Time: {slot['time']}, Boat: {slot.get('service_type', 'Unknown')}"
-            if 'slots' in slot and slot['slots'] > 1:
-                slot_info += f", Slots: {slot['slots']}"
-            print(slot_info)
-        print("===========================\n")
+        # Log notification to console; skip building the summary when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            lines = ["\n=== NEW AVAILABLE SLOTS ==="]
+            for slot in formatted_slots:
+                slot_info = f"Date: {slot['date']}, Time: {slot['time']}, Boat: {slot.get('service_type', 'Unknown')}"
+                if 'slots' in slot and slot['slots'] > 1:
+                    slot_info = f"{slot_info}, Slots: {slot['slots']}"
+                lines.append(slot_info)
+            lines.append("===========================\n")
+            logger.info("\n".join(lines))
         
-        # Send Slack notification
-        self.notifier.send_slot_notification(formatted_slots)
+        # Send Slack notification; posts to all webhooks run concurrently off the event loop
+        await self.notifier.send_slot_notification_async(formatted_slots)
 
 
 async def main():
@@ -275,4 +273,5 @@ async def main():
     await monitor.start_monitoring()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
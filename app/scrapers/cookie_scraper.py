@@ -145,13 +145,27 @@ async def scrape_with_saved_cookies():
         await browser.close()
         return results
 
+class AuthenticationError(Exception):
+    """Raised when no authenticated YAM session could be established."""
+
 async def scrape_calendar_slots_for_days(days=14, filters=None):
+    """Return the calendar slots as a list, or False if authentication failed."""
+    try:
+        return [slot async for slot in iter_calendar_slots_for_days(days, filters)]
+    except AuthenticationError:
+        return False
+
+async def iter_calendar_slots_for_days(days=14, filters=None):
+    """Yield calendar slots as each day is scraped instead of returning them all at the end.
+
+    Raises AuthenticationError if logging in fails, so callers can tell that apart from an empty calendar.
+    """
     if not os.path.exists(COOKIES_FILE):
         print("No saved cookies found. Performing authentication first...")
         success = await save_authenticated_session()
         if not success:
             print("Failed to authenticate.")
-            return False
+            raise AuthenticationError("Failed to authenticate")
     
     if not os.path.exists(DATA_DIR):
         os.makedirs(DATA_DIR)
@@ -159,6 +173,10 @@ async def scrape_calendar_slots_for_days(days=14, filters=None):
     with open(COOKIES_FILE, "r") as f:
         cookies = json.load(f)
     
+    if filters:
+        from app.utils.filter_slots import filter_slots
+    
+    scraped_count = 0
     all_slots = []
     
     async with async_playwright() as p:
@@ -190,8 +208,10 @@ async def scrape_calendar_slots_for_days(days=14, filters=None):
             success = await save_authenticated_session()
             if not success:
                 print("Failed to re-authenticate.")
-                return False
-            return await scrape_calendar_slots_for_days(days, filters)
+                raise AuthenticationError("Failed to re-authenticate")
+            async for slot in iter_calendar_slots_for_days(days, filters):
+                yield slot
+            return
         
         all_slots_file = ALL_SLOTS_FILE
         
@@ -206,7 +226,12 @@ async def scrape_calendar_slots_for_days(days=14, filters=None):
             current_date = datetime.now().strftime("%d/%m/%Y")
         
         day_slots = await extract_slots_from_page(page, current_date)
+        scraped_count += len(day_slots)
+        if filters:
+            day_slots = filter_slots(day_slots, **filters)
         all_slots.extend(day_slots)
+        for slot in day_slots:
+            yield slot
         
         for day in range(1, days):
             print(f"Navigating to day {day}...")
@@ -237,25 +262,26 @@ async def scrape_calendar_slots_for_days(days=14, filters=None):
                     print(f"Calculated date: {date}")
                 
                 day_slots = await extract_slots_from_page(page, date)
+                scraped_count += len(day_slots)
+                if filters:
+                    day_slots = filter_slots(day_slots, **filters)
                 all_slots.extend(day_slots)
+                for slot in day_slots:
+                    yield slot
             else:
                 print("Could not find next day button. Stopping navigation.")
                 break
         
-        # Apply filters if provided
-        filtered_slots = all_slots
+        # Filters were applied per day as slots were yielded
         if filters:
-            from app.utils.filter_slots import filter_slots
-            filtered_slots = filter_slots(all_slots, **filters)
-            print(f"Applied filters: {len(all_slots)} -> {len(filtered_slots)} slots")
+            print(f"Applied filters: {scraped_count} -> {len(all_slots)} slots")
         
         with open(all_slots_file, "w", encoding="utf-8") as f:
-            json.dump(filtered_slots if filters else all_slots, f, ensure_ascii=False, indent=2)
+            json.dump(all_slots, f, ensure_ascii=False, indent=2)
         
         print(f"Saved slots data to {all_slots_file}")
         
         await browser.close()
-        return filtered_slots if filters else all_slots
 
 async def extract_slots_from_page(page, date):
     slots = []
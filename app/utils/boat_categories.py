@@ -51,9 +51,9 @@ def group_slots_by_category(slots):
         "unknown": []
     }
     
+    # Classification is a plain dict lookup, so do it inline rather than per-slot calls
+    category_of = BOAT_TO_CATEGORY.get
     for slot in slots:
-        boat_type = slot.get("service_type", "")
-        category = get_boat_category(boat_type)
-        categorized_slots[category].append(slot)
+        categorized_slots[category_of(slot.get("service_type", ""), "unknown")].append(slot)
     
     return categorized_slots
@@ -1,4 +1,5 @@
-from datetime import datetime, date, time
+import re
+from datetime import date, time
 from typing import Optional
 
 HEBREW_MONTH_NAMES = {
@@ -8,11 +9,27 @@ HEBREW_MONTH_NAMES = {
     "אוקטובר": "October", "נובמבר": "November", "דצמבר": "December"
 }
 
-HEBREW_DAY_NAMES = {
-    "ראשון": "sunday", "שני": "monday", "שלישי": "tuesday",
-    "רביעי": "wednesday", "חמישי": "thursday", "שישי": "friday", "שבת": "saturday"
+HEBREW_DAY_TO_ENGLISH = {
+    "ראשון": "Sunday", "שני": "Monday", "שלישי": "Tuesday",
+    "רביעי": "Wednesday", "חמישי": "Thursday", "שישי": "Friday", "שבת": "Saturday"
 }
 
+HEBREW_DAY_NAMES = {hebrew: english.lower() for hebrew, english in HEBREW_DAY_TO_ENGLISH.items()}
+
+# Three-letter English abbreviations ("Sun", "Jan") for compact dates
+HEBREW_DAY_SHORT = {hebrew: english[:3] for hebrew, english in HEBREW_DAY_TO_ENGLISH.items()}
+HEBREW_MONTH_SHORT = {hebrew: english[:3] for hebrew, english in HEBREW_MONTH_NAMES.items()}
+
+# Hebrew or (case-insensitive) English month name -> month number
+_MONTH_NUMBERS = {name: i for i, name in enumerate(HEBREW_MONTH_NAMES, 1)}
+_MONTH_NUMBERS.update({name.lower(): i for i, name in enumerate(HEBREW_MONTH_NAMES.values(), 1)})
+
+# "<day name>, <day> <month> <year>"
+_HEBREW_DATE_RE = re.compile(r"[^,]*,\s*(\d{1,2})\s+(\S+)\s+(\d{4})(?:\s|$)")
+# The start time must be the whole string or be followed by " - ", so unspaced ranges
+# like "14:00-18:00" are rejected as they always were
+_START_TIME_RE = re.compile(r"\s*(\d+):(\d+)(?::\d+)?\s*(?: - |$)")
+
 WEEKDAY_INDEX_TO_NAME = {
     0: "monday", 1: "tuesday", 2: "wednesday", 3: "thursday",
     4: "friday", 5: "saturday", 6: "sunday"
@@ -23,21 +40,16 @@ def parse_hebrew_date(date_str: str) -> Optional[date]:
     """Parse Hebrew date format (e.g., 'שישי, 12 אפריל 2025') to Python date."""
     if not date_str or not isinstance(date_str, str):
         return None
+    match = _HEBREW_DATE_RE.match(date_str)
+    if not match:
+        return None
+    day_num, month_name, year = match.groups()
+    month = _MONTH_NUMBERS.get(month_name) or _MONTH_NUMBERS.get(month_name.lower())
+    if month is None:
+        return None
     try:
-        if "," not in date_str:
-            return None
-        _, date_part = date_str.split(",", 1)
-        date_part = date_part.strip()
-        parts = date_part.split()
-        if len(parts) < 3:
-            return None
-        day_num = parts[0]
-        month_name = parts[1]
-        year = parts[2]
-        if month_name in HEBREW_MONTH_NAMES:
-            month_name = HEBREW_MONTH_NAMES[month_name]
-        return datetime.strptime(f"{day_num} {month_name} {year}", "%d %B %Y").date()
-    except (ValueError, IndexError):
+        return date(int(year), month, int(day_num))
+    except ValueError:
         return None
 
 
@@ -56,16 +68,12 @@ def parse_slot_start_time(time_str: str) -> Optional[time]:
     """Parse slot time string (e.g., '14:00 - 18:00') and return start time."""
     if not time_str or not isinstance(time_str, str):
         return None
-    try:
-        if " - " in time_str:
-            start_str = time_str.split(" - ")[0].strip()
-        else:
-            start_str = time_str.strip()
-        parts = start_str.split(":")
-        if len(parts) >= 2:
-            return time(int(parts[0]), int(parts[1]))
+    match = _START_TIME_RE.match(time_str)
+    if not match:
         return None
-    except (ValueError, IndexError):
+    try:
+        return time(int(match.group(1)), int(match.group(2)))
+    except ValueError:
         return None
 
 
@@ -0,0 +1,28 @@
+import json
+import os
+
+# orjson is optional; it encodes the monitor state files and Slack payloads faster than the stdlib
+try:
+    import orjson
+    
+    def json_dumps(obj, pretty=False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, compact unless pretty is set."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj, pretty=False) -> bytes:
+        """Serialize to UTF-8 JSON bytes, compact unless pretty is set."""
+        if pretty:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    json_loads = json.loads
+
+
+def atomic_write_json(path, data, pretty=False):
+    """Write JSON to a temp file and rename it over the target, so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(json_dumps(data, pretty=pretty))
+    os.replace(tmp_path, path)
@@ -1,8 +1,11 @@
 import re
+from collections import defaultdict
+
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})')
 
 def parse_time(time_str):
     """Extract hours and minutes from a time string"""
-    match = re.search(r'(\d{1,2}):(\d{2})', time_str)
+    match = _TIME_RE.search(time_str)
     if match:
         hour, minute = map(int, match.groups())
         return hour * 60 + minute  # Convert to minutes for easier comparison
@@ -17,7 +20,7 @@ def merge_consecutive_slots(slots):
         return []
     
     # Group slots by date and boat type
-    grouped_slots = {}
+    grouped_slots = defaultdict(list)
     for slot in slots:
         date = slot.get('date', '')
         boat = slot.get('service_type', '')
@@ -27,43 +30,37 @@ def merge_consecutive_slots(slots):
         if not is_available:
             continue
             
-        key = f"{date}_{boat}"
-        if key not in grouped_slots:
-            grouped_slots[key] = []
-        grouped_slots[key].append(slot)
+        grouped_slots[f"{date}_{boat}"].append(slot)
     
     result = []
     
     # Process each group
-    for key, group in grouped_slots.items():
-        # Sort slots by start time
-        sorted_slots = sorted(group, key=lambda x: parse_time(x.get('time', '').split(' - ')[0]))
+    for group in grouped_slots.values():
+        # Split each slot's time range once: (start minutes, start, end, slot)
+        timed_slots = []
+        for slot in group:
+            time_parts = slot.get('time', '').split(' - ')
+            start = time_parts[0].strip()
+            end = time_parts[1].strip() if len(time_parts) == 2 else None
+            timed_slots.append((parse_time(start), start, end, slot))
         
-        # Find consecutive slots
-        current_sequence = [sorted_slots[0]]
+        # Sort slots numerically by start time; unparseable times go last
+        timed_slots.sort(key=lambda timed: (timed[0] is None, timed[0] or 0))
         
-        for i in range(1, len(sorted_slots)):
-            prev_slot = current_sequence[-1]
-            curr_slot = sorted_slots[i]
-            
-            prev_time_parts = prev_slot.get('time', '').split(' - ')
-            curr_time_parts = curr_slot.get('time', '').split(' - ')
-            
-            if len(prev_time_parts) == 2 and len(curr_time_parts) == 2:
-                prev_end = prev_time_parts[1].strip()
-                curr_start = curr_time_parts[0].strip()
-                
-                # Check if slots are consecutive
-                if prev_end == curr_start:
-                    current_sequence.append(curr_slot)
-                else:
-                    # Process the completed sequence
-                    result.extend(process_sequence(current_sequence))
-                    current_sequence = [curr_slot]
+        # Find consecutive slots in one linear scan
+        current_sequence = [timed_slots[0][3]]
+        prev_end = timed_slots[0][2]
+        
+        for _, curr_start, curr_end, curr_slot in timed_slots[1:]:
+            # Consecutive when the previous slot ends where this one starts
+            # (an invalid time format is treated as non-consecutive)
+            if prev_end is not None and curr_end is not None and prev_end == curr_start:
+                current_sequence.append(curr_slot)
             else:
-                # Invalid time format, treat as non-consecutive
+                # Process the completed sequence
                 result.extend(process_sequence(current_sequence))
                 current_sequence = [curr_slot]
+            prev_end = curr_end
         
         # Process the last sequence
         result.extend(process_sequence(current_sequence))
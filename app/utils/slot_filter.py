@@ -3,6 +3,7 @@ from app.utils.date_utils import (
     parse_hebrew_date, calculate_days_ahead, get_weekday_name,
     parse_slot_start_time, is_time_in_range
 )
+from app.forecasts.swell_forecast import get_forecast_for_slot
 
 
 def apply_weather_filters(filters: Dict, forecast: Dict) -> Tuple[bool, str]:
@@ -73,7 +74,6 @@ def should_notify_slot(slot: Dict, config: Dict) -> Tuple[bool, str]:
         if not filters:
             return True, "OK (no weather filters)"
         try:
-            from app.forecasts.swell_forecast import get_forecast_for_slot
             forecast = get_forecast_for_slot(slot)
         except Exception as e:
             print(f"Error getting forecast: {e}")